@@ -63,6 +63,18 @@ def getCorFromCov(covMat):
     corMat[covMat == 0] = 0
     return corMat
 
+####################################################################################################################################
+#### getCorFromCovBatch
+####################################################################################################################################
+
+def getCorFromCovBatch(covMat):
+    # covMat is a stack of covariance matrices of shape (...,ndim,ndim).
+    # the scaling by the inverse standard deviations is done by einsum in a single sweep over covMat.
+    inverseStdVec = 1. / np.sqrt(np.einsum("...ii->...i", covMat))
+    corMat = np.einsum("...ij,...i,...j->...ij", covMat, inverseStdVec, inverseStdVec)
+    corMat[covMat == 0] = 0
+    return corMat
+
 ####################################################################################################################################
 #### CorCovMat class
 ####################################################################################################################################
@@ -40,6 +40,8 @@
 ####################################################################################################################################
 ####################################################################################################################################
 
+import os
+import mmap
 import numpy as np
 import pandas as pd
 import _paramonte as pm
@@ -51,12 +53,135 @@ from paramonte.vis.EllipsoidPlot import EllipsoidPlot
 Struct = pm.Struct
 newline = pm.newline
 
+try:
+    import _RestartParser # the optional C extension, built by setup.py if a C compiler is available
+    restartParserEnabled = True
+except ImportError:
+    restartParserEnabled = False
+
+# the Numba kernel is imported on demand by _loadNumbaKernel(), as importing numba slows down the import of paramonte.
+# numbaEnabled becomes False if numba cannot be imported. _fillRecords remains None until the kernel is imported.
+
+numbaEnabled = True
+_fillRecords = None
+
+# the size of the smallest restart file (in bytes) parsed with the Numba kernel before the kernel is first used.
+# compiling the kernel, or even loading it from the cache, costs more than parsing a smaller file with the alternatives.
+
+_numbaMinFileSize = 2**25
+
 # amazingly strange. If Struct is taken from outside this module,
 # it will automatically add: isParaDRAM, isParaNest, isParaTemp attributes
 # print("\nself.contents.isParaDRAM: {}\n".format(self.contents.isParaDRAM))
 # issue resolved: self._method = pm.Struct in _ParaMonteSampler (without parentheses, it does not instantiate).
 # class Struct: pass
 
+# the classification of the restart plot types: (isLine, isScatter, isCovMat, isCorMat)
+
+_plotTypeFlagsDict =    { "line"        : ( True    , False , False , False )
+                        , "scatter"     : ( False   , True  , False , False )
+                        , "lineScatter" : ( True    , True  , False , False )
+                        , "covmat2"     : ( False   , False , True  , False )
+                        , "covmat3"     : ( False   , False , True  , False )
+                        , "cormat2"     : ( False   , False , False , True  )
+                        , "cormat3"     : ( False   , False , False , True  )
+                        }
+
+# the translation table of the Fortran double-precision exponent letters to those understood by float().
+
+_exponentTable = bytes.maketrans(b"dD", b"eE")
+
+####################################################################################################################################
+#### _loadNumbaKernel
+####################################################################################################################################
+
+def _loadNumbaKernel():
+    """
+    Import the Numba kernel of the restart file parser into ``_fillRecords``, 
+    if it is not imported yet, and return ``True`` if the kernel is available.
+    """
+    global numbaEnabled, _fillRecords
+    if numbaEnabled and _fillRecords is None:
+        try:
+            from _RestartKernel import fillRecords as _fillRecords
+        except ImportError:
+            numbaEnabled = False
+    return numbaEnabled
+
+####################################################################################################################################
+#### _getSymFromTri
+####################################################################################################################################
+
+def _getSymFromTri(triMat, ndim):
+    # expand the stack of packed row-major lower triangles triMat to symmetric matrices of shape (count,ndim,ndim).
+    # every element is written by one of the two triangle assignments, so the matrices need no initialization.
+    triRowIndex, triColIndex = np.tril_indices(ndim)
+    symMat = np.empty((triMat.shape[0],ndim,ndim))
+    symMat[:,triRowIndex,triColIndex] = triMat
+    symMat[:,triColIndex,triRowIndex] = triMat
+    return symMat
+
+####################################################################################################################################
+#### RestartContents
+####################################################################################################################################
+
+class RestartContents(Struct):
+    """
+
+    This is the **RestartContents** class for the ``contents`` component of
+    the ``RestartFileContents`` objects. The covariance matrices are stored 
+    in packed lower-triangular form. The full ``covMat`` and ``corMat`` arrays 
+    of shape ``(count, ndim, ndim)`` are generated upon their first access.
+
+    """
+
+    def __init__( self
+                , ndim
+                , covMatPacked
+                ):
+        self._ndim = ndim
+        self._covMatPacked = covMatPacked
+        self._covMat = None
+        self._corMat = None
+
+    @property
+    def covMat(self):
+        if self._covMat is None: self._covMat = _getSymFromTri(self._covMatPacked, self._ndim)
+        return self._covMat
+
+    @property
+    def corMat(self):
+        if self._corMat is None: self._corMat = ccm.getCorFromCovBatch(self.covMat)
+        return self._corMat
+
+####################################################################################################################################
+#### _LazyPlots
+####################################################################################################################################
+
+class _LazyPlots(Struct):
+    """
+
+    This is the **_LazyPlots** class for the ``plot`` component of the 
+    ``RestartFileContents`` objects. Each plot object is generated upon 
+    its first access, so that reading the restart file does not pay for 
+    the construction of plots that are never used.
+
+    """
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    def __getattr__(self, name):
+        # called only if name is not already an attribute, that is, if the plot has not been generated yet.
+        owner = self.__dict__.get("_owner")
+        if owner is not None and name in owner._plotTypeList:
+            owner._resetPlot(resetType = "hard", plotNames = name)
+            return self.__dict__[name]
+        raise AttributeError("'plot' object has no attribute '" + name + "'")
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._owner._plotTypeList))
+
 ####################################################################################################################################
 #### RestartFileContents
 ####################################################################################################################################
@@ -121,10 +246,13 @@ class RestartFileContents(OutputFileContents):
         self.ndim = None
         self.count = None
         self.contents = None
+        self._df = None
+        self._dfScalars = None
         self._fileType = "restart"
-        self._contents = []
-        self._lineList = []
-        self._lineListLen = []
+        self._contents = None
+        self._lineStart = None
+        self._lineEnd = None
+        self._lineListLen = None
         self.propNameList = []
 
         if self._methodName == pm.names.paradram:
@@ -137,6 +265,23 @@ class RestartFileContents(OutputFileContents):
                     , methodName = "ParaMonte"
                     )
 
+    ################################################################################################################################
+    #### df
+    ################################################################################################################################
+
+    @property
+    def df(self):
+        """
+
+        The pandas DataFrame of the scalar properties of the restart file
+        updates. It is generated upon its first access and cached afterwards.
+        The DataFrame is a single block that shares its data with the scalar
+        arrays in ``contents``, which are never modified after parsing.
+
+        """
+        if self._df is None: self._df = pd.DataFrame(self._dfScalars, columns = self.propNameList[0:4], copy = False)
+        return self._df
+
     ################################################################################################################################
     #### _readRestartParaDRAM
     ################################################################################################################################
@@ -158,116 +303,227 @@ class RestartFileContents(OutputFileContents):
         #### data
         ############################################################################################################################
 
-        with open(self.file,"r") as fid: self._contents = fid.read().replace(pm.creturn,"")
-        self._lineList = self._contents.split(pm.newline)
-        self._lineListLen = len(self._lineList)
-
-        # find count of updates
+        scalars, fieldNamesDict = self._readRestartParaDRAMText()
 
-        self.count = self._contents.count(self.propNameList[0])
+        self._progress.updateBar(1)
 
-        # find ndim via meanVec entry: self.propNameList[4]
+        # covMat and corMat are generated by contents from the packed covMat on demand
 
-        rowOffset = 0;
-        while self.propNameList[4] not in self._lineList[rowOffset]:
-            rowOffset = rowOffset + 1
-            if rowOffset > self._lineListLen: self._reportCorruptFile()
-        rowOffset = rowOffset + 1 # the first numeric value of the meanVec
+        self.contents = RestartContents( ndim = self.ndim, covMatPacked = fieldNamesDict[self.propNameList[5]] )
+        for fieldName in self.propNameList[0:5]: setattr(self.contents, fieldName, fieldNamesDict[fieldName])
+        self._dfScalars = scalars # the data frame is generated upon the first access to df
 
-        self.ndim = 0
-        while pm.utils.isNumericString( self._lineList[rowOffset+self.ndim] ): self.ndim += 1
-        if self.ndim==0: self._reportCorruptFile()
+        self._progress.note()
 
-        # parse the restart file contents
+        ############################################################################################################################
+        #### graphics
+        ############################################################################################################################
 
-        fieldNamesDict =    { self.propNameList[0] : np.zeros(self.count)
-                            , self.propNameList[1] : np.zeros(self.count)
-                            , self.propNameList[2] : np.zeros(self.count)
-                            , self.propNameList[3] : np.zeros(self.count)
-                            , self.propNameList[4] : np.zeros((self.count,self.ndim))
-                            , self.propNameList[5] : np.zeros((self.count,self.ndim,self.ndim))
-                            , self.propNameList[6] : np.zeros((self.count,self.ndim,self.ndim))
-                            }
+        self._plotTypeList =    [ "line"
+                                , "scatter"
+                                , "lineScatter"
+                                ]
 
-        skip = 10 + (self.ndim * (self.ndim + 3)) // 2
-        progressFraction = np.floor( self.count / 20 )
-        for icount in range(self.count):
+        if self.ndim>1: self._plotTypeList +=   [ "covmat2"
+                                                , "covmat3"
+                                                , "cormat2"
+                                                , "cormat3"
+                                                ]
 
-            if icount%progressFraction==0: self._progress.updateBar(icount/self.count-1)
+        # the plots are generated upon their first access
 
-            istart = icount * skip + 1
+        self.plot = _LazyPlots(self)
+        self.plot.reset = self._resetPlot
 
-            rowOffset = 0
-            fieldNamesDict[self.propNameList[0]][icount] = np.double( self._lineList[istart+rowOffset] )
+    ################################################################################################################################
+    #### _readRestartParaDRAMText
+    ################################################################################################################################
 
-            rowOffset = 2
-            fieldNamesDict[self.propNameList[1]][icount] = np.double( self._lineList[istart+rowOffset] )
+    def _readRestartParaDRAMText(self):
+
+        # map the file into memory and index its lines by the positions of the newline bytes.
+        # Windows line endings leave a trailing carriage return on each line, which the parsers ignore.
+
+        with open(self.file, "rb") as fid:
+            try:
+                self._contents = mmap.mmap(fid.fileno(), 0, access = mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # the file cannot be mapped (e.g., it is empty or on an unsupported file system).
+                # read its raw bytes into a single bytes object without decoding instead.
+                self._contents = self._readBytes(fid.fileno())
+        if len(self._contents)==0: self._reportCorruptFile()
+        buffer = np.frombuffer(self._contents, dtype = np.uint8)
+        newlineIndex = np.flatnonzero(buffer == ord(newline))
+        self._lineStart = np.concatenate(( [0], newlineIndex + 1 ))
+        self._lineEnd = np.concatenate(( newlineIndex, [buffer.size] ))
+        self._lineListLen = self._lineStart.size
+
+        # find the starting line of each update by matching the leading bytes of all lines against the update header.
+        # each comparison only involves the lines that have matched all preceding bytes of the header.
+
+        header = self.propNameList[0].encode()
+        recordStart = np.flatnonzero(self._lineEnd - self._lineStart >= len(header))
+        for ibyte, byte in enumerate(header): recordStart = recordStart[ buffer[self._lineStart[recordStart] + ibyte] == byte ]
+        recordStartByte = self._lineStart[recordStart]
+        self.count = recordStart.size
+        if self.count==0: self._reportCorruptFile()
+
+        # find ndim via meanVec entry of the first update: self.propNameList[4]
+
+        rowOffset = recordStart[0] + 8
+        if rowOffset >= self._lineListLen or self.propNameList[4].encode() not in self._getLine(rowOffset): self._reportCorruptFile()
+        rowOffset = rowOffset + 1 # the first numeric value of the meanVec
 
-            rowOffset = 4
-            fieldNamesDict[self.propNameList[2]][icount] = np.double( self._lineList[istart+rowOffset] )
+        # parse the entire meanVec of the first update, up to the covMat header, in a single call
 
-            rowOffset = 6
-            fieldNamesDict[self.propNameList[3]][icount] = np.double( self._lineList[istart+rowOffset] )
+        meanVecByteStart = self._lineStart[rowOffset]
+        meanVecByteEnd = self._contents.find(self.propNameList[5].encode(), meanVecByteStart)
+        if meanVecByteEnd < 0: self._reportCorruptFile()
+        try:
+            self.ndim = np.fromstring( self._contents[meanVecByteStart:meanVecByteEnd].translate(_exponentTable), sep = " " ).size
+        except ValueError: # raised by newer NumPy releases on non-numeric contents
+            self._reportCorruptFile()
+        if self.ndim==0 or rowOffset + self.ndim != np.searchsorted(self._lineStart, meanVecByteEnd): self._reportCorruptFile()
 
-            rowOffset = 8
-            iend = istart + rowOffset + self.ndim
-            fieldNamesDict[self.propNameList[4]][icount,:] = np.double( self._lineList[istart+rowOffset:iend] )
+        # parse the restart file contents
 
-            iend += 1 # the first numeric element of the covariance matrix
-            for i in range(self.ndim): # covmat
-                iPlusOne = i + 1
-                istart = iend
-                iend = istart + iPlusOne
-                #print("\n{}".format(np.double( self._lineList[istart:iend]) ))
-                fieldNamesDict[self.propNameList[5]][icount,i,0:iPlusOne] = np.double( self._lineList[istart:iend] )
-                fieldNamesDict[self.propNameList[5]][icount,0:iPlusOne,i] = fieldNamesDict[self.propNameList[5]][icount,i,0:iPlusOne]
+        skip = 10 + (self.ndim * (self.ndim + 3)) // 2
+        # the records are written back to back, starting at the first line of the file.
 
-            fieldNamesDict[self.propNameList[6]][icount,:,:] = ccm.getCorFromCov( fieldNamesDict[self.propNameList[5]][icount,:,:] )
+        if recordStart[0] != 0 or recordStart[-1] + skip > self._lineListLen or np.any(np.diff(recordStart) != skip): self._reportCorruptFile()
 
-            #print("\n") # xxx
-            #print(self.ndim) # xxx
-            #print(self.count) # xxx
-            #print(self.propNameList[0]+"\n"+str(fieldNamesDict[self.propNameList[0]][icount])) # xxx
-            #print(self.propNameList[1]+"\n"+str(fieldNamesDict[self.propNameList[1]][icount])) # xxx
-            #print(self.propNameList[2]+"\n"+str(fieldNamesDict[self.propNameList[2]][icount])) # xxx
-            #print(self.propNameList[3]+"\n"+str(fieldNamesDict[self.propNameList[3]][icount])) # xxx
-            #print(self.propNameList[4]+"\n"+str(fieldNamesDict[self.propNameList[4]][icount])) # xxx
-            #print(self.propNameList[5]+"\n"+str(fieldNamesDict[self.propNameList[5]][icount,:,:])) # xxx
-            #print(ccm.getCorFromCov( fieldNamesDict[self.propNameList[6]][icount,:,:] )) # xxx
-            #break # xxx
+        # the four scalar properties of each update are stored contiguously in a single array
 
-        self._progress.updateBar(1)
+        scalars = np.empty((self.count,4))
+        fieldNamesDict =    { self.propNameList[0] : scalars[:,0]
+                            , self.propNameList[1] : scalars[:,1]
+                            , self.propNameList[2] : scalars[:,2]
+                            , self.propNameList[3] : scalars[:,3]
+                            , self.propNameList[4] : np.empty((self.count,self.ndim))
+                            , self.propNameList[5] : np.empty((self.count,(self.ndim*(self.ndim+1))//2))
+                            }
 
-        self.contents = Struct()
-        for fieldName in self.propNameList: setattr(self.contents, fieldName, fieldNamesDict[fieldName])
-        _ = fieldNamesDict.pop(self.propNameList[4])
-        _ = fieldNamesDict.pop(self.propNameList[5])
-        _ = fieldNamesDict.pop(self.propNameList[6]) # get rid of meanVec, covMat, corMat
-        self.df = pd.DataFrame.from_dict(fieldNamesDict)
+        # the parallel Numba kernel is preferred over the C extension, as it is considerably faster,
+        # but only once its one-time compilation cost in each process is paid off by the size of the file.
+
+        if numbaEnabled and ( buffer.size >= _numbaMinFileSize or _fillRecords is not None ) and _loadNumbaKernel():
+
+            recordLen = 4 + (self.ndim * (self.ndim + 3)) // 2
+            unparsed = np.empty((self.count,recordLen), dtype = np.bool_)
+            _fillRecords( buffer
+                        , self._lineStart
+                        , self._lineEnd
+                        , recordStart
+                        , self.ndim
+                        , scalars
+                        , fieldNamesDict[self.propNameList[4]]
+                        , fieldNamesDict[self.propNameList[5]]
+                        , unparsed
+                        )
+
+            # convert the rare values that could not be parsed with a guaranteed correct rounding.
+            # float() also handles NaN and Infinity and raises ValueError for non-numeric text.
+
+            rowOffset = np.concatenate(( [1, 3, 5, 7], np.arange(9, 9 + self.ndim), np.arange(10 + self.ndim, skip) ))
+            for icount, ielement in zip(*np.nonzero(unparsed)):
+                try:
+                    value = float( self._getLine(recordStart[icount] + rowOffset[ielement]).translate(_exponentTable) )
+                except ValueError:
+                    self._reportCorruptFile()
+                if ielement < 4:
+                    scalars[icount,ielement] = value
+                elif ielement < 4 + self.ndim:
+                    fieldNamesDict[self.propNameList[4]][icount,ielement-4] = value
+                else:
+                    fieldNamesDict[self.propNameList[5]][icount,ielement-4-self.ndim] = value
+            del unparsed
+
+        elif restartParserEnabled:
+
+            try:
+                _RestartParser.fillRecords  ( self._contents
+                                            , recordStartByte
+                                            , self.ndim
+                                            , scalars
+                                            , fieldNamesDict[self.propNameList[4]]
+                                            , fieldNamesDict[self.propNameList[5]]
+                                            )
+            except ValueError:
+                self._reportCorruptFile()
 
-        self._progress.note()
+        else:
 
-        ############################################################################################################################
-        #### graphics
-        ############################################################################################################################
+            # blank out the header lines of all records and parse the remaining numeric contents in a single call.
+            # the header mask is expanded from lines to bytes, which keeps the temporary arrays at one byte per file byte.
+
+            lineFirst = recordStart[0]
+            lineLast = recordStart[-1] + skip - 1
+            byteStart = self._lineStart[lineFirst]
+            byteEnd = self._lineEnd[lineLast]
+            isHeaderLine = np.zeros(lineLast - lineFirst + 1, dtype = np.bool_)
+            isHeaderLine[ ( recordStart[:,np.newaxis] + np.array([ 0, 2, 4, 6, 8, 9 + self.ndim ]) ).flatten() - lineFirst ] = True
+            lineLength = np.append( np.diff(self._lineStart[lineFirst:lineLast+1]), byteEnd - self._lineStart[lineLast] )
+            recordBytes = np.array(buffer[byteStart:byteEnd])
+            recordBytes[ np.repeat(isHeaderLine, lineLength) ] = ord(" ")
+            del lineLength
+
+            # each numeric line must hold exactly one value, as required by the other parsers.
+
+            isToken = recordBytes > ord(" ")
+            tokenLine = np.searchsorted( self._lineStart[lineFirst:lineLast+1] - byteStart, np.flatnonzero(isToken[1:] > isToken[:-1]) + 1, side = "right" ) - 1
+            del isToken
+            if not np.array_equal(tokenLine, np.flatnonzero(~isHeaderLine)): self._reportCorruptFile()
+            del tokenLine, isHeaderLine
+
+            recordBytes[ recordBytes == ord("D") ] = ord("E") # Fortran double-precision exponents
+            recordBytes[ recordBytes == ord("d") ] = ord("E")
+            recordBytes = recordBytes.tobytes()
+            try:
+                recordList = np.fromstring( recordBytes, sep = " " )
+            except ValueError: # raised by newer NumPy releases on non-numeric contents
+                self._reportCorruptFile()
+            del recordBytes
+            recordLen = 4 + (self.ndim * (self.ndim + 3)) // 2
+            if recordList.size != self.count * recordLen: self._reportCorruptFile()
+            recordList = recordList.reshape(self.count, recordLen)
+
+            scalars[:,:] = recordList[:,0:4]
+            fieldNamesDict[self.propNameList[4]][:,:] = recordList[:,4:4+self.ndim]
+            fieldNamesDict[self.propNameList[5]][:,:] = recordList[:,4+self.ndim:]
+
+        # release the file contents and the line index, which are no longer needed.
+        # the memory map can be closed only after the array views of it are gone.
+
+        del buffer
+        if isinstance(self._contents, mmap.mmap): self._contents.close()
+        self._contents = None
+        self._lineStart = None
+        self._lineEnd = None
+        self._lineListLen = None
+
+        return scalars, fieldNamesDict
 
-        self._plotTypeList =    [ "line"
-                                , "scatter"
-                                , "lineScatter"
-                                ]
+    ################################################################################################################################
+    #### _readBytes
+    ################################################################################################################################
 
-        if self.ndim>1: self._plotTypeList +=   [ "covmat2"
-                                                , "covmat3"
-                                                , "cormat2"
-                                                , "cormat3"
-                                                ]
+    def _readBytes(self, fd):
+        # os.read() may return fewer bytes than requested for very large files, hence the loop.
+        byteCount = os.fstat(fd).st_size
+        chunkList = []
+        while byteCount > 0:
+            chunk = os.read(fd, byteCount)
+            if len(chunk)==0: break
+            chunkList.append(chunk)
+            byteCount -= len(chunk)
+        return chunkList[0] if len(chunkList)==1 else b"".join(chunkList)
 
-        self._progress.note( msg = "adding the graphics tools... ", end = newline, pre = True )
-        self.plot = Struct()
-        self._resetPlot(resetType="hard")
-        self._progress.note()
+    ################################################################################################################################
+    #### _getLine
+    ################################################################################################################################
 
-        self.plot.reset = self._resetPlot
+    def _getLine(self, iline):
+        return self._contents[self._lineStart[iline]:self._lineEnd[iline]]
 
     ################################################################################################################################
     #### _reportCorruptFile
@@ -342,6 +598,7 @@ class RestartFileContents(OutputFileContents):
         elif isinstance(plotNames, list):
             for plotName in plotNames:
                 if plotName not in self._plotTypeList: self._reportWrongPlotName(plotName)
+            requestedPlotTypeList = plotNames
         else:
             self._reportWrongPlotName("a none-string none-list object.")
 
@@ -368,13 +625,7 @@ class RestartFileContents(OutputFileContents):
         for requestedPlotType in requestedPlotTypeList:
 
             plotObject = None
-            requestedPlotTypeLower = requestedPlotType.lower()
-
-           #is3d        = "3"           in requestedPlotTypeLower
-            isLine      = "line"        in requestedPlotTypeLower
-            isScatter   = "scatter"     in requestedPlotTypeLower
-            isCovMat    = "covmat"      in requestedPlotTypeLower
-            isCorMat    = "cormat"      in requestedPlotTypeLower
+            isLine, isScatter, isCovMat, isCorMat = _plotTypeFlagsDict[requestedPlotType]
 
             if not resetTypeIsHard:
                 plotComponent = getattr(self, "plot")
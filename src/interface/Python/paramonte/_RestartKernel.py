@@ -0,0 +1,201 @@
+####################################################################################################################################
+####################################################################################################################################
+####
+####   MIT License
+####
+####   ParaMonte: plain powerful parallel Monte Carlo library.
+####
+####   Copyright (C) 2012-present, The Computational Data Science Lab
+####
+####   This file is part of the ParaMonte library.
+####
+####   Permission is hereby granted, free of charge, to any person obtaining a 
+####   copy of this software and associated documentation files (the "Software"), 
+####   to deal in the Software without restriction, including without limitation 
+####   the rights to use, copy, modify, merge, publish, distribute, sublicense, 
+####   and/or sell copies of the Software, and to permit persons to whom the 
+####   Software is furnished to do so, subject to the following conditions:
+####
+####   The above copyright notice and this permission notice shall be 
+####   included in all copies or substantial portions of the Software.
+####
+####   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+####   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF 
+####   MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. 
+####   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, 
+####   DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR 
+####   OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE 
+####   OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+####
+####   ACKNOWLEDGMENT
+####
+####   ParaMonte is an honor-ware and its currency is acknowledgment and citations.
+####   As per the ParaMonte library license agreement terms, if you use any parts of 
+####   this library for any purposes, kindly acknowledge the use of ParaMonte in your 
+####   work (education/research/industry/development/...) by citing the ParaMonte 
+####   library as described on this page:
+####
+####       https://github.com/cdslaborg/paramonte/blob/master/ACKNOWLEDGMENT.md
+####
+####################################################################################################################################
+####################################################################################################################################
+
+# the Numba kernel of the ParaDRAM restart file parser, imported by _RestartFileContents only when needed,
+# as importing numba, and compiling or loading the kernel from the cache, adds a noticeable startup cost.
+
+import math
+import numpy as np
+from numba import njit, prange
+
+####################################################################################################################################
+#### _twoProduct
+####################################################################################################################################
+
+@njit(cache=True)
+def _twoProduct(a, b):
+    # return the rounded product of a and b and its exact rounding error (Dekker's algorithm).
+    product = a * b
+    temp = 134217729. * a # 2**27 + 1
+    aHi = temp - (temp - a)
+    aLo = a - aHi
+    temp = 134217729. * b
+    bHi = temp - (temp - b)
+    bLo = b - bHi
+    return product, ((aHi * bHi - product) + aHi * bLo + aLo * bHi) + aLo * bLo
+
+####################################################################################################################################
+#### _parseFloatAscii
+####################################################################################################################################
+
+@njit(cache=True)
+def _parseFloatAscii(buf, start, end):
+    """
+    Return a tuple ``(value, parsed)`` where ``value`` is the correctly-rounded floating-point 
+    value of the ASCII decimal number stored in ``buf[start:end]`` and ``parsed`` is ``True``.
+    Leading and trailing whitespace are ignored. Both ``e`` and ``d`` exponent letters are accepted.
+    If the number cannot be converted here with a guaranteed correct rounding (e.g., it has more 
+    than 18 significant digits or a large decimal exponent, or it is ``NaN``, ``Infinity``, or not 
+    a number at all), ``(NaN, False)`` is returned and the caller must convert the text otherwise.
+    """
+
+    while start < end and (buf[start] == 32 or buf[start] == 9 or buf[start] == 13): start += 1
+    while end > start and (buf[end-1] == 32 or buf[end-1] == 9 or buf[end-1] == 13): end -= 1
+    if start == end: return np.nan, False
+
+    sign = 1.
+    if buf[start] == 43 or buf[start] == 45: # '+' or '-'
+        if buf[start] == 45: sign = -1.
+        start += 1
+
+    mantissa = 0
+    ndigit = 0
+    exponent = 0
+    digitFound = False
+    pointFound = False
+    i = start
+    while i < end:
+        char = buf[i]
+        if 48 <= char and char <= 57: # digit
+            digitFound = True
+            if ndigit < 18:
+                mantissa = mantissa * 10 + (char - 48)
+                if mantissa > 0: ndigit += 1
+                if pointFound: exponent -= 1
+            elif char != 48:
+                return np.nan, False # a nonzero digit does not fit in the mantissa
+            elif not pointFound:
+                exponent += 1
+        elif char == 46 and not pointFound: # '.'
+            pointFound = True
+        else:
+            break
+        i += 1
+    if not digitFound: return np.nan, False
+
+    if i < end:
+        char = buf[i]
+        if char != 69 and char != 101 and char != 68 and char != 100: return np.nan, False # 'E', 'e', 'D', 'd'
+        i += 1
+        expSign = 1
+        if i < end and (buf[i] == 43 or buf[i] == 45):
+            if buf[i] == 45: expSign = -1
+            i += 1
+        if i == end or end - i > 4: return np.nan, False
+        expValue = 0
+        while i < end:
+            char = buf[i]
+            if char < 48 or char > 57: return np.nan, False
+            expValue = expValue * 10 + (char - 48)
+            i += 1
+        exponent += expSign * expValue
+
+    if mantissa == 0: return sign * 0., True
+    if exponent < -22 or exponent > 22: return np.nan, False # the power of ten is not exact
+    power = 10.**abs(exponent)
+
+    # the mantissa and the power of ten are both exact, hence a single correctly-rounded operation.
+
+    if mantissa < 9007199254740992: # 2**53
+        if exponent < 0: return sign * (float(mantissa) / power), True
+        return sign * (float(mantissa) * power), True
+
+    # otherwise, represent the mantissa exactly as the unevaluated sum mantissaHi + mantissaLo,
+    # compute the result in double-double arithmetic as valueHi + valueLo, and accept valueHi only 
+    # if the exact result is certainly not on the other side of the rounding midpoint of valueHi.
+
+    mantissaHi = float(mantissa)
+    mantissaLo = float(mantissa - np.int64(mantissaHi))
+    if exponent < 0:
+        quotient = mantissaHi / power
+        product, productError = _twoProduct(quotient, power)
+        correction = (((mantissaHi - product) - productError) + mantissaLo) / power
+    else:
+        quotient, productError = _twoProduct(mantissaHi, power)
+        correction = productError + mantissaLo * power
+    valueHi = quotient + correction
+    valueLo = correction - (valueHi - quotient)
+    fraction, binaryExponent = math.frexp(valueHi)
+    halfGap = math.ldexp(0.5, binaryExponent - 53)
+    if fraction == 0.5 and valueLo < 0.: halfGap *= 0.5 # the gap below a power of two is half as wide
+    if halfGap - abs(valueLo) <= math.ldexp(valueHi, -96): return np.nan, False
+    return sign * valueHi, True
+
+####################################################################################################################################
+#### fillRecords
+####################################################################################################################################
+
+@njit(cache=True, parallel=True)
+def fillRecords(buf, lineStart, lineEnd, recordStart, ndim, scalars, meanVec, covMatPacked, unparsed):
+    """
+    Parse the ParaDRAM restart records stored in the byte buffer ``buf`` whose lines 
+    start and end at ``lineStart`` and ``lineEnd`` and whose first lines are ``recordStart``, 
+    and write the results into the preallocated arrays ``scalars``, ``meanVec``, and ``covMatPacked``.
+    The lower triangle of each covariance matrix is stored in ``covMatPacked`` in row-major order.
+    The values that ``_parseFloatAscii()`` could not convert are marked as ``True`` in the 
+    boolean array ``unparsed`` of shape ``(count, 4 + ndim + ndim * (ndim + 1) / 2)``.
+    The records are parsed in parallel, as each record is read from and written to disjoint locations.
+    """
+
+    for icount in prange(recordStart.size):
+
+        istart = recordStart[icount] + 1
+
+        for iscalar in range(4): # rowOffset = 0, 2, 4, 6
+            iline = istart + 2 * iscalar
+            value, parsed = _parseFloatAscii(buf, lineStart[iline], lineEnd[iline])
+            scalars[icount,iscalar] = value
+            unparsed[icount,iscalar] = not parsed
+
+        iline = istart + 8
+        for i in range(ndim):
+            value, parsed = _parseFloatAscii(buf, lineStart[iline], lineEnd[iline])
+            meanVec[icount,i] = value
+            unparsed[icount,4+i] = not parsed
+            iline += 1
+
+        iline += 1 # the first numeric element of the lower triangle of the covariance matrix
+        for itri in range(covMatPacked.shape[1]):
+            value, parsed = _parseFloatAscii(buf, lineStart[iline], lineEnd[iline])
+            covMatPacked[icount,itri] = value
+            unparsed[icount,4+ndim+itri] = not parsed
+            iline += 1
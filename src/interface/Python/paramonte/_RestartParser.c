@@ -0,0 +1,219 @@
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////
+////   MIT License
+////
+////   ParaMonte: plain powerful parallel Monte Carlo library.
+////
+////   Copyright (C) 2012-present, The Computational Data Science Lab
+////
+////   This file is part of the ParaMonte library.
+////
+////   Permission is hereby granted, free of charge, to any person obtaining a 
+////   copy of this software and associated documentation files (the "Software"), 
+////   to deal in the Software without restriction, including without limitation 
+////   the rights to use, copy, modify, merge, publish, distribute, sublicense, 
+////   and/or sell copies of the Software, and to permit persons to whom the 
+////   Software is furnished to do so, subject to the following conditions:
+////
+////   The above copyright notice and this permission notice shall be 
+////   included in all copies or substantial portions of the Software.
+////
+////   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+////   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF 
+////   MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. 
+////   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, 
+////   DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR 
+////   OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE 
+////   OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+////
+////   ACKNOWLEDGMENT
+////
+////   ParaMonte is an honor-ware and its currency is acknowledgment and citations.
+////   As per the ParaMonte library license agreement terms, if you use any parts of 
+////   this library for any purposes, kindly acknowledge the use of ParaMonte in your 
+////   work (education/research/industry/development/...) by citing the ParaMonte 
+////   library as described on this page:
+////
+////       https://github.com/cdslaborg/paramonte/blob/master/ACKNOWLEDGMENT.md
+////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+
+// This is the optional C extension of the ParaMonte Python library for parsing the ASCII restart files
+// of the ParaDRAM sampler. If this extension is not available, the library falls back to the Python parsers
+// in _RestartFileContents.py. Each restart record has the following line structure:
+//
+//      meanAcceptanceRateSinceStart
+//      value
+//      sampleSize
+//      value
+//      logSqrtDeterminant
+//      value
+//      adaptiveScaleFactorSquared
+//      value
+//      meanVec
+//      ndim values, one per line
+//      covMat
+//      ndim * (ndim + 1) / 2 values of the lower triangle in row-major order, one per line
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+
+#define MAX_NUMBER_LEN 127
+
+// Read the line starting at *pos, advance *pos to the beginning of the next line, 
+// and if value is not NULL, convert the line contents to a double in value.
+// Return 0 on success and -1 with a Python exception set on failure.
+static int readLine(const char **pos, const char *end, double *value)
+{
+    const char *lineStart = *pos;
+    const char *lineEnd;
+    char number[MAX_NUMBER_LEN + 1];
+    size_t len, i;
+
+    if (lineStart >= end) {
+        PyErr_SetString(PyExc_ValueError, "unexpected end of the restart file contents.");
+        return -1;
+    }
+    lineEnd = memchr(lineStart, '\n', (size_t)(end - lineStart));
+    if (lineEnd == NULL) lineEnd = end;
+    *pos = lineEnd < end ? lineEnd + 1 : end;
+    if (value == NULL) return 0;
+
+    // trim the whitespace, including the carriage return of Windows line endings.
+
+    while (lineStart < lineEnd && (*lineStart == ' ' || *lineStart == '\t' || *lineStart == '\r')) ++lineStart;
+    while (lineEnd > lineStart && (lineEnd[-1] == ' ' || lineEnd[-1] == '\t' || lineEnd[-1] == '\r')) --lineEnd;
+    len = (size_t)(lineEnd - lineStart);
+    if (len == 0 || len > MAX_NUMBER_LEN) {
+        PyErr_SetString(PyExc_ValueError, "invalid numeric value in the restart file contents.");
+        return -1;
+    }
+
+    // copy to a null-terminated buffer, since the file contents are not null-terminated.
+    // The Fortran double-precision exponent letter is replaced with the C exponent letter.
+
+    memcpy(number, lineStart, len);
+    number[len] = '\0';
+    for (i = 0; i < len; ++i) if (number[i] == 'd' || number[i] == 'D') number[i] = 'e';
+
+    *value = PyOS_string_to_double(number, NULL, NULL);
+    if (*value == -1.0 && PyErr_Occurred()) return -1;
+    return 0;
+}
+
+static int getBuffer(PyObject *object, Py_buffer *view, int flags, Py_ssize_t itemsize, const char *name)
+{
+    if (PyObject_GetBuffer(object, view, flags) < 0) return -1;
+    if (view->itemsize != itemsize) {
+        PyErr_Format(PyExc_TypeError, "%s must be a contiguous array of %zd-byte items.", name, itemsize);
+        PyBuffer_Release(view);
+        return -1;
+    }
+    return 0;
+}
+
+PyDoc_STRVAR(fillRecords_doc,
+"fillRecords(buffer, recordStartByte, ndim, scalars, meanVec, covMatPacked)\n"
+"\n"
+"Parse the ParaDRAM restart records stored in the bytes-like object ``buffer`` whose\n"
+"first bytes are at the int64 offsets ``recordStartByte``, and write the results into the\n"
+"preallocated writable float64 arrays ``scalars`` of shape ``(count, 4)``, ``meanVec`` of shape\n"
+"``(count, ndim)``, and ``covMatPacked`` of shape ``(count, ndim * (ndim + 1) / 2)``.\n"
+"A ValueError is raised if the contents do not match the restart file structure.");
+
+static PyObject *fillRecords(PyObject *self, PyObject *args)
+{
+    PyObject *bufferObject, *recordStartObject, *scalarsObject, *meanVecObject, *covMatObject;
+    Py_buffer buffer, recordStart, scalars, meanVec, covMat;
+    Py_ssize_t ndim, ntri, count, icount, i;
+    PyObject *result = NULL;
+
+    (void)self;
+    if (!PyArg_ParseTuple(args, "OOnOOO", &bufferObject, &recordStartObject, &ndim, &scalarsObject, &meanVecObject, &covMatObject)) return NULL;
+    if (ndim < 1) {
+        PyErr_SetString(PyExc_ValueError, "ndim must be a positive integer.");
+        return NULL;
+    }
+    ntri = ndim * (ndim + 1) / 2;
+
+    if (PyObject_GetBuffer(bufferObject, &buffer, PyBUF_SIMPLE) < 0) return NULL;
+    if (getBuffer(recordStartObject, &recordStart, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT, sizeof(int64_t), "recordStartByte") < 0) goto release_buffer;
+    if (getBuffer(scalarsObject, &scalars, PyBUF_C_CONTIGUOUS | PyBUF_WRITABLE | PyBUF_FORMAT, sizeof(double), "scalars") < 0) goto release_recordStart;
+    if (getBuffer(meanVecObject, &meanVec, PyBUF_C_CONTIGUOUS | PyBUF_WRITABLE | PyBUF_FORMAT, sizeof(double), "meanVec") < 0) goto release_scalars;
+    if (getBuffer(covMatObject, &covMat, PyBUF_C_CONTIGUOUS | PyBUF_WRITABLE | PyBUF_FORMAT, sizeof(double), "covMatPacked") < 0) goto release_meanVec;
+
+    count = recordStart.len / (Py_ssize_t)sizeof(int64_t);
+    if (scalars.len != 4 * count * (Py_ssize_t)sizeof(double)
+        || meanVec.len != count * ndim * (Py_ssize_t)sizeof(double)
+        || covMat.len != count * ntri * (Py_ssize_t)sizeof(double)) {
+        PyErr_SetString(PyExc_ValueError, "the sizes of the output arrays do not match the record count and ndim.");
+        goto release_all;
+    }
+
+    {
+        const char *begin = (const char *)buffer.buf;
+        const char *end = begin + buffer.len;
+        const int64_t *recordStartByte = (const int64_t *)recordStart.buf;
+        double *scalarsData = (double *)scalars.buf;
+        double *meanVecData = (double *)meanVec.buf;
+        double *covMatData = (double *)covMat.buf;
+        const char *pos;
+
+        for (icount = 0; icount < count; ++icount) {
+            if (recordStartByte[icount] < 0 || recordStartByte[icount] >= buffer.len) {
+                PyErr_SetString(PyExc_ValueError, "record offset out of the restart file contents.");
+                goto release_all;
+            }
+            pos = begin + recordStartByte[icount];
+            for (i = 0; i < 4; ++i) { // the four scalars, each following its name
+                if (readLine(&pos, end, NULL) < 0) goto release_all;
+                if (readLine(&pos, end, scalarsData + icount * 4 + i) < 0) goto release_all;
+            }
+            if (readLine(&pos, end, NULL) < 0) goto release_all; // meanVec
+            for (i = 0; i < ndim; ++i) if (readLine(&pos, end, meanVecData + icount * ndim + i) < 0) goto release_all;
+            if (readLine(&pos, end, NULL) < 0) goto release_all; // covMat
+            for (i = 0; i < ntri; ++i) if (readLine(&pos, end, covMatData + icount * ntri + i) < 0) goto release_all;
+        }
+    }
+
+    Py_INCREF(Py_None);
+    result = Py_None;
+
+release_all:
+    PyBuffer_Release(&covMat);
+release_meanVec:
+    PyBuffer_Release(&meanVec);
+release_scalars:
+    PyBuffer_Release(&scalars);
+release_recordStart:
+    PyBuffer_Release(&recordStart);
+release_buffer:
+    PyBuffer_Release(&buffer);
+    return result;
+}
+
+static PyMethodDef methods[] = {
+    {"fillRecords", fillRecords, METH_VARARGS, fillRecords_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef moduleDef = {
+    PyModuleDef_HEAD_INIT,
+    "_RestartParser",
+    "The C parser of the ParaDRAM ASCII restart files.",
+    -1,
+    methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC PyInit__RestartParser(void)
+{
+    return PyModule_Create(&moduleDef);
+}
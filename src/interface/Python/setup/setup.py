@@ -55,6 +55,11 @@ setuptools.setup( name                          = "paramonte"
                 , long_description_content_type = "text/markdown"
                 , url                           = "https://github.com/cdslaborg/paramonte"
                 , packages                      = setuptools.find_packages()
+                , ext_modules                   =   [ setuptools.Extension  ( "paramonte._RestartParser"
+                                                                            , sources = ["paramonte/_RestartParser.c"]
+                                                                            , optional = True # fall back to the Python parsers if the build fails
+                                                                            )
+                                                    ]
                 , python_requires               = '>=3.0'
                 , license                       = "License :: OSI Approved :: MIT License"
                 , include_package_data          = True
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+#!C:\ProgramData\Anaconda3\python.exe
+####################################################################################################################################
+####################################################################################################################################
+####
+####   MIT License
+####
+####   ParaMonte: plain powerful parallel Monte Carlo library.
+####
+####   Copyright (C) 2012-present, The Computational Data Science Lab
+####
+####   This file is part of the ParaMonte library.
+####
+####   Permission is hereby granted, free of charge, to any person obtaining a 
+####   copy of this software and associated documentation files (the "Software"), 
+####   to deal in the Software without restriction, including without limitation 
+####   the rights to use, copy, modify, merge, publish, distribute, sublicense, 
+####   and/or sell copies of the Software, and to permit persons to whom the 
+####   Software is furnished to do so, subject to the following conditions:
+####
+####   The above copyright notice and this permission notice shall be 
+####   included in all copies or substantial portions of the Software.
+####
+####   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+####   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF 
+####   MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. 
+####   IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, 
+####   DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR 
+####   OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE 
+####   OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+####
+####   ACKNOWLEDGMENT
+####
+####   ParaMonte is an honor-ware and its currency is acknowledgment and citations.
+####   As per the ParaMonte library license agreement terms, if you use any parts of 
+####   this library for any purposes, kindly acknowledge the use of ParaMonte in your 
+####   work (education/research/industry/development/...) by citing the ParaMonte 
+####   library as described on this page:
+####
+####       https://github.com/cdslaborg/paramonte/blob/master/ACKNOWLEDGMENT.md
+####
+####################################################################################################################################
+####################################################################################################################################
+
+
+####################################################################################################################################
+#### parse the same generated ParaDRAM restart file with every available backend of RestartFileContents and compare the results.
+####################################################################################################################################
+
+import os
+import tempfile
+import numpy as np
+import paramonte # also makes the internal modules of the package importable
+import _RestartFileContents as rfc
+
+ndim = 4
+count = 200
+propNameList = ["meanAcceptanceRateSinceStart", "sampleSize", "logSqrtDeterminant", "adaptiveScaleFactorSquared", "meanVec", "covMat"]
+
+np.random.seed(7)
+lineList = []
+for icount in range(count):
+    scalarList = [ np.random.rand(), np.random.randint(1, 10000), np.random.randn(), 1. + np.random.rand() ]
+    for propName, value in zip(propNameList[0:4], scalarList): lineList += [ propName, "  {:.16E}".format(value) ]
+    lineList += [ propNameList[4] ] + [ "  {:.16E}".format(value) for value in np.random.randn(ndim) ]
+    mat = np.random.randn(ndim,ndim)
+    covMat = mat @ mat.T * 10.**np.random.randint(-40,40)
+    lineList += [ propNameList[5] ] + [ "  {:.16E}".format(covMat[i,j]).replace("E","D") for i in range(ndim) for j in range(i+1) ]
+
+backendList = [ ("NumPy", False, False) ]
+if rfc.numbaEnabled: backendList.append( ("Numba", True, False) )
+if rfc.restartParserEnabled: backendList.append( ("C", False, True) )
+
+def readRestart(lineList):
+    """
+    Write ``lineList`` to a temporary restart file and read it with every backend in ``backendList``.
+    Return the list of the resulting ``RestartFileContents`` objects, with ``None`` for the backends that reject the file.
+    """
+    fd, file = tempfile.mkstemp(suffix = "_restart.txt")
+    with os.fdopen(fd, "w") as fout: fout.write("\n".join(lineList) + "\n")
+    numbaEnabled, restartParserEnabled, numbaMinFileSize = rfc.numbaEnabled, rfc.restartParserEnabled, rfc._numbaMinFileSize
+    rfc._numbaMinFileSize = 0 # use the Numba kernel regardless of the file size
+    restartList = []
+    try:
+        for backend, rfc.numbaEnabled, rfc.restartParserEnabled in backendList:
+            print("reading the restart file with the " + backend + " backend...")
+            try:
+                restartList.append( rfc.RestartFileContents(file, "ParaDRAM", False) )
+            except Exception: # pm.abort() on corrupt files
+                restartList.append(None)
+    finally:
+        rfc.numbaEnabled, rfc.restartParserEnabled, rfc._numbaMinFileSize = numbaEnabled, restartParserEnabled, numbaMinFileSize
+        os.remove(file)
+    return restartList
+
+# the well-formed file must be read identically by all backends
+
+expected = np.array([ float(line.replace("D","E")) for line in lineList if line.startswith(" ") ])
+triRow, triCol = np.tril_indices(ndim)
+for (backend, _, _), restart in zip(backendList, readRestart(lineList)):
+    assert restart is not None, backend + " backend rejects a valid restart file."
+    assert restart.count == count and restart.ndim == ndim, backend
+    contents = restart.contents
+    recordList = np.hstack([ restart.df.values, contents.meanVec, contents.covMat[:,triRow,triCol] ])
+    assert np.array_equal(recordList.flatten(), expected), backend + " backend does not reproduce the restart file contents."
+
+# the malformed files must be rejected by all backends
+
+skip = 10 + (ndim * (ndim + 3)) // 2
+malformedDict = { "a junk line between records" : lineList[:skip] + ["  1.0"] + lineList[skip:]
+                , "a junk line before the first record" : ["  1.0"] + lineList
+                , "two values on one line followed by an empty line" : lineList[:9] + ["  1.0 1.0", ""] + lineList[11:]
+                , "a non-numeric value" : lineList[:skip+1] + ["  abc"] + lineList[skip+2:]
+                }
+for malformation, malformedLineList in malformedDict.items():
+    for (backend, _, _), restart in zip(backendList, readRestart(malformedLineList)):
+        assert restart is None, backend + " backend accepts a restart file with " + malformation + "."
+
+print("all restart backends agree: " + ", ".join(backend for backend, _, _ in backendList))